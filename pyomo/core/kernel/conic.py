@@ -9,7 +9,15 @@
 #  ___________________________________________________________________________
 """Various conic constraint implementations."""
 
+import array
+import math
+import operator
+
+from pyomo.common.dependencies import (attempt_import,
+                                       numpy,
+                                       numpy_available)
 from pyomo.core.expr.numvalue import is_numeric_data
+from pyomo.core.util import quicksum
 from pyomo.core.expr.current import (value,
                                      exp)
 from pyomo.core.kernel.block import block
@@ -21,6 +29,39 @@ from pyomo.core.kernel.constraint import (IConstraint,
                                           constraint,
                                           constraint_tuple)
 
+# both numpy and numba are deferred imports: nothing is
+# actually imported until the first numeric evaluation
+# needs it, so importing this module stays cheap
+numba, numba_available = attempt_import('numba')
+
+# plain-bool mirrors of the deferred import indicators,
+# resolved on first use so the hot evaluation path does
+# not re-check the indicator objects on every call
+_use_numpy = None
+_use_numba = None
+
+def _resolve_numeric_backends():
+    global _use_numpy, _use_numba
+    _use_numpy = bool(numpy_available)
+    _use_numba = bool(numba_available)
+
+# replaces a float division with a multiply in the
+# dual_exponential numeric evaluation path
+_INV_E = 1.0/math.e
+
+# C-level bulk extraction of variable values (faster than
+# a generator of per-iteration attribute lookups)
+_get_value = operator.attrgetter('value')
+
+def _all_variables(objs):
+    """Returns True if every object is a kernel variable.
+    Only used for construction-time validation, which is
+    stripped when Python is run with -O."""
+    for obj in objs:
+        if not isinstance(obj, IVariable):
+            return False
+    return True
+
 def _build_linking_constraints(v, v_aux):
     assert len(v) == len(v_aux)
     c_aux = []
@@ -44,6 +85,104 @@ def _build_linking_constraints(v, v_aux):
                            rhs=0))
     return constraint_tuple(c_aux)
 
+_numba_sum_sq = None
+
+def _get_numba_sum_sq():
+    """Returns the numba-compiled sum-of-squares kernel,
+    compiling it on first use. The kernel is cached on disk
+    (cache=True) so the compile cost is only paid once per
+    installation."""
+    global _numba_sum_sq
+    if _numba_sum_sq is None:
+        @numba.njit(cache=True, fastmath=True)
+        def _sum_sq(v):
+            s = 0.0
+            for i in range(v.shape[0]):
+                s += v[i]*v[i]
+            return s
+        _numba_sum_sq = _sum_sq
+    return _numba_sum_sq
+
+_compiled_sum_sq_cache = {}
+
+def _compiled_sum_sq(n):
+    """Returns a compiled straight-line sum-of-squares
+    kernel for vectors of length n. Kernels are cached at
+    the module level (code objects can not be pickled, so
+    they are never stored on constraint instances)."""
+    code = _compiled_sum_sq_cache.get(n)
+    if code is None:
+        src = "+".join("x[%d]*x[%d]" % (i, i)
+                       for i in range(n))
+        code = _compiled_sum_sq_cache[n] = \
+            compile(src if n > 0 else "0.0",
+                    "<conic sum-of-squares>",
+                    "eval")
+    return code
+
+# functional forms of the straight-line numeric body
+# kernels; the %s placeholder receives the unrolled sum of
+# squares and `oma` abbreviates one-minus-alpha
+_BODY_KERNEL_FORMS = {
+    'quadratic':
+        "(%s) - r*r",
+    'rotated_quadratic':
+        "(%s) - 2.0*r1*r2",
+    'primal_power':
+        "((%s)**0.5) - (r1**alpha)*(r2**oma)",
+    'dual_power':
+        "((%s)**0.5) - ((r1/alpha)**alpha)*((r2/oma)**oma)",
+}
+
+_compiled_body_cache = {}
+
+def _compiled_body(form, n):
+    """Returns a compiled straight-line numeric body kernel
+    specialized to the given functional form and x-vector
+    length. Like the sum-of-squares kernels, these are
+    cached at the module level because code objects can not
+    be pickled."""
+    key = (form, n)
+    code = _compiled_body_cache.get(key)
+    if code is None:
+        ssq = "+".join("x[%d]*x[%d]" % (i, i)
+                       for i in range(n)) if n > 0 else "0.0"
+        code = _compiled_body_cache[key] = \
+            compile(_BODY_KERNEL_FORMS[form] % (ssq,),
+                    "<conic body>",
+                    "eval")
+    return code
+
+# below this length, the overhead of building a numpy
+# array and crossing the C-API outweighs the vectorized
+# dot product (the crossover is near 50 elements)
+_NUMPY_SUM_SQ_THRESHOLD = 50
+
+# above this length, stop generating straight-line kernels
+# (source size grows with the term count) and fall back to
+# a C-level accumulation
+_COMPILED_SUM_SQ_MAX = 64
+
+def _sum_of_squares_numeric(x):
+    """Computes a sum of squares over numeric values.
+    Long vectors dispatch to numpy (C-level dot product)
+    when it is available; short vectors use a compiled
+    straight-line kernel that avoids both the numpy
+    dispatch overhead and per-term interpreter dispatch."""
+    if _use_numpy is None:
+        _resolve_numeric_backends()
+    n = len(x)
+    if _use_numpy and n >= _NUMPY_SUM_SQ_THRESHOLD:
+        v = numpy.fromiter(x, dtype=float, count=n)
+        if _use_numba:
+            return _get_numba_sum_sq()(v)
+        return numpy.dot(v, v)
+    if n <= _COMPILED_SUM_SQ_MAX:
+        return eval(_compiled_sum_sq(n), {"x": x})
+    # no numpy: accumulate in C via math.fsum, which also
+    # improves precision over naive summation
+    return math.fsum(xi*xi for xi in x)
+
 class _ConicBase(IConstraint):
     """Base class for a few conic constraints that
     implements some shared functionality. Derived classes
@@ -60,6 +199,13 @@ class _ConicBase(IConstraint):
         # (i.e., when someone asks for it via the body
         # property method)
         self._body = None
+        # stores the key and result of the most recent
+        # numeric evaluation (see __call__)
+        self._value_cache = (None, None)
+        # stores the domain fingerprint and result of the
+        # most recent continuity sweep used by the
+        # convexity checks (see _x_all_continuous)
+        self._convexity_cache = (None, None)
 
     @classmethod
     def as_domain(cls, *args, **kwds):
@@ -70,11 +216,24 @@ class _ConicBase(IConstraint):
         """A function that defines the body expression"""
         raise NotImplementedError     #pragma:nocover
 
-    def _body_function_variables(self, values=False):
-        """Returns variables in the order they should be
-        passed to the body function. If values is True, then
-        return the current value of each variable in place
-        of the variables themselves."""
+    def _body_function_numeric(self, *args):
+        """Numerically evaluates the body function given
+        the current value of each argument. Subclasses can
+        override this with a specialized implementation
+        that avoids building expression nodes."""
+        # we wrap the result with value(...) as the
+        # alpha term used by some of the constraints
+        # may be a parameter
+        return value(self._body_function(*args))
+
+    def _vars_symbolic(self):
+        """Returns the variables in the order they should
+        be passed to the body function."""
+        raise NotImplementedError     #pragma:nocover
+
+    def _vars_numeric(self):
+        """Returns the current value of each body function
+        argument, in the same order as _vars_symbolic."""
         raise NotImplementedError     #pragma:nocover
 
     def check_convexity_conditions(self, relax=False):
@@ -93,18 +252,25 @@ class _ConicBase(IConstraint):
         """The body of the constraint"""
         if self._body is None:
             self._body = self._body_function(
-                *self._body_function_variables(values=False))
+                *self._vars_symbolic())
         return self._body
 
-    @property
-    def lb(self):
-        """The lower bound of the constraint"""
-        return None
+    # the bounds and equality flag are identical constants
+    # for every conic constraint, so they are stored as
+    # class attributes: a plain attribute read skips the
+    # descriptor call that a property would pay on hot
+    # preprocessing paths (instances remain read-only
+    # because the __slots__ declarations do not include
+    # these names)
 
-    @property
-    def ub(self):
-        """The upper bound of the constraint"""
-        return 0.0
+    #: The lower bound of the constraint
+    lb = None
+
+    #: The upper bound of the constraint
+    ub = 0.0
+
+    #: Conic constraints are never equality constraints
+    equality = False
 
     @property
     def rhs(self):
@@ -113,27 +279,46 @@ class _ConicBase(IConstraint):
             "The rhs property can not be read because this "
             "is not an equality constraint")
 
-    @property
-    def equality(self):
-        return False
-
     #
     # Override a the default __call__ method on IConstraint
     # to avoid building the body expression, if possible
     #
 
+    def _evaluation_key(self):
+        """A key that identifies the current variable
+        values, used to memoize the result of __call__.
+        The variables themselves are fixed at construction,
+        so their values alone identify an evaluation."""
+        return tuple(map(_get_value, self._flat_vars))
+
+    def _x_all_continuous(self):
+        """Returns True if every variable in the x tuple is
+        continuous. The O(n) sweep is memoized against the
+        variable domain types, so repeated convexity checks
+        on an unmodified constraint avoid it."""
+        fp = tuple(xi.domain_type for xi in self._x)
+        cached_fp, cached_result = self._convexity_cache
+        if fp == cached_fp:
+            return cached_result
+        result = all(xi.is_continuous() for xi in self._x)
+        self._convexity_cache = (fp, result)
+        return result
+
     def __call__(self, exception=True):
+        key = self._evaluation_key()
+        cached_key, cached_val = self._value_cache
+        if key == cached_key:
+            return cached_val
         try:
-            # we wrap the result with value(...) as the
-            # alpha term used by some of the constraints
-            # may be a parameter
-            return value(self._body_function(
-                *self._body_function_variables(values=True)))
+            val = self._body_function_numeric(
+                *self._vars_numeric())
         except (ValueError, TypeError):
             if exception:
                 raise ValueError("one or more terms "
                                  "could not be evaluated")
             return None
+        self._value_cache = (key, val)
+        return val
 
 class quadratic(_ConicBase):
     """A quadratic conic constraint of the form:
@@ -153,6 +338,12 @@ class quadratic(_ConicBase):
                  "_storage_key",
                  "_active",
                  "_body",
+                 "_value_cache",
+                 "_convexity_cache",
+                 "_flat_vars",
+                 "_sym_args",
+                 "_n_x",
+                 "_val_buf",
                  "_r",
                  "_x",
                  "__weakref__")
@@ -160,9 +351,13 @@ class quadratic(_ConicBase):
         super(quadratic, self).__init__()
         self._r = r
         self._x = tuple(x)
-        assert isinstance(self._r, IVariable)
-        assert all(isinstance(xi, IVariable)
-                   for xi in self._x)
+        self._flat_vars = self._x + (self._r,)
+        self._sym_args = (self._r, self._x)
+        self._n_x = len(self._x)
+        # a reusable buffer for gathering variable values,
+        # so numeric evaluation does not allocate per call
+        self._val_buf = array.array('d', [0.0]*self._n_x)
+        assert _all_variables(self._flat_vars)
 
     @classmethod
     def as_domain(cls, r, x):
@@ -202,27 +397,54 @@ class quadratic(_ConicBase):
 
     def _body_function(self, r, x):
         """A function that defines the body expression"""
-        return sum(xi**2 for xi in x) - r**2
-
-    def _body_function_variables(self, values=False):
-        """Returns variables in the order they should be
-        passed to the body function. If values is True, then
-        return the current value of each variable in place
-        of the variables themselves."""
-        if not values:
-            return self.r, self.x
-        else:
-            return self.r.value, tuple(xi.value for xi in self.x)
+        # xi*xi and r*r allocate cheaper product nodes than
+        # xi**2, and quicksum builds one flat sum in place
+        # of a chain of binary sums
+        return quicksum(xi*xi for xi in x) - r*r
+
+    def _body_function_numeric(self, r, x):
+        """Numerically evaluates the body function given
+        the current value of each argument."""
+        if self._n_x < _NUMPY_SUM_SQ_THRESHOLD:
+            return eval(_compiled_body('quadratic', self._n_x),
+                        {"x": x, "r": r})
+        return _sum_of_squares_numeric(x) - r**2
+
+    def _vars_symbolic(self):
+        """Returns the variables in the order they should
+        be passed to the body function."""
+        return self._sym_args
+
+    def _vars_numeric(self):
+        """Returns the current value of each body function
+        argument, in the same order as _vars_symbolic."""
+        flat = self._flat_vars
+        buf = self._val_buf
+        for i in range(self._n_x):
+            buf[i] = flat[i].value
+        return flat[self._n_x].value, buf
 
     def check_convexity_conditions(self, relax=False):
         """Returns True if all convexity conditions for the
         conic constraint are satisfied. If relax is True,
         then variable domains are ignored and it is assumed
-        that all variables are continuous."""
-        return (relax or \
-                (self.r.is_continuous() and \
-                 all(xi.is_continuous() for xi in self.x))) and \
-            (self.r.has_lb() and value(self.r.lb) >= 0)
+        that all variables are continuous. Conditions are
+        evaluated cheapest-first so that a failing scalar
+        test avoids the sweep over the x variables."""
+        # ordered cheapest-first: the scalar bound tests
+        # short-circuit the O(n) continuity sweep
+        # each bound is fetched and value()-evaluated once:
+        # has_lb/has_ub would re-evaluate the bound for
+        # their infinity test, and an infinite bound can
+        # never satisfy the sign test anyway
+        r_lb = self._r.lb
+        if (r_lb is None) or (value(r_lb) < 0):
+            return False
+        if relax:
+            return True
+        if not self._r.is_continuous():
+            return False
+        return self._x_all_continuous()
 
 class rotated_quadratic(_ConicBase):
     """A rotated quadratic conic constraint of the form:
@@ -244,6 +466,12 @@ class rotated_quadratic(_ConicBase):
                  "_storage_key",
                  "_active",
                  "_body",
+                 "_value_cache",
+                 "_convexity_cache",
+                 "_flat_vars",
+                 "_sym_args",
+                 "_n_x",
+                 "_val_buf",
                  "_r1",
                  "_r2",
                  "_x",
@@ -254,10 +482,13 @@ class rotated_quadratic(_ConicBase):
         self._r1 = r1
         self._r2 = r2
         self._x = tuple(x)
-        assert isinstance(self._r1, IVariable)
-        assert isinstance(self._r2, IVariable)
-        assert all(isinstance(xi, IVariable)
-                   for xi in self._x)
+        self._flat_vars = self._x + (self._r1, self._r2)
+        self._sym_args = (self._r1, self._r2, self._x)
+        self._n_x = len(self._x)
+        # a reusable buffer for gathering variable values,
+        # so numeric evaluation does not allocate per call
+        self._val_buf = array.array('d', [0.0]*self._n_x)
+        assert _all_variables(self._flat_vars)
 
     @classmethod
     def as_domain(cls, r1, r2, x):
@@ -303,30 +534,57 @@ class rotated_quadratic(_ConicBase):
 
     def _body_function(self, r1, r2, x):
         """A function that defines the body expression"""
-        return sum(xi**2 for xi in x) - 2*r1*r2
-
-    def _body_function_variables(self, values=False):
-        """Returns variables in the order they should be
-        passed to the body function. If values is True, then
-        return the current value of each variable in place
-        of the variables themselves."""
-        if not values:
-            return self.r1, self.r2, self.x
-        else:
-            return self.r1.value, self.r2.value, \
-                tuple(xi.value for xi in self.x)
+        return quicksum(xi*xi for xi in x) - 2*r1*r2
+
+    def _body_function_numeric(self, r1, r2, x):
+        """Numerically evaluates the body function given
+        the current value of each argument."""
+        if self._n_x < _NUMPY_SUM_SQ_THRESHOLD:
+            return eval(_compiled_body('rotated_quadratic',
+                                       self._n_x),
+                        {"x": x, "r1": r1, "r2": r2})
+        return _sum_of_squares_numeric(x) - 2*r1*r2
+
+    def _vars_symbolic(self):
+        """Returns the variables in the order they should
+        be passed to the body function."""
+        return self._sym_args
+
+    def _vars_numeric(self):
+        """Returns the current value of each body function
+        argument, in the same order as _vars_symbolic."""
+        flat = self._flat_vars
+        buf = self._val_buf
+        n = self._n_x
+        for i in range(n):
+            buf[i] = flat[i].value
+        return flat[n].value, flat[n+1].value, buf
 
     def check_convexity_conditions(self, relax=False):
         """Returns True if all convexity conditions for the
         conic constraint are satisfied. If relax is True,
         then variable domains are ignored and it is assumed
-        that all variables are continuous."""
-        return (relax or \
-                (self.r1.is_continuous() and \
-                 self.r2.is_continuous() and \
-                 all(xi.is_continuous() for xi in self.x))) and \
-            (self.r1.has_lb() and value(self.r1.lb) >= 0) and \
-            (self.r2.has_lb() and value(self.r2.lb) >= 0)
+        that all variables are continuous. Conditions are
+        evaluated cheapest-first so that a failing scalar
+        test avoids the sweep over the x variables."""
+        # ordered cheapest-first: the scalar bound tests
+        # short-circuit the O(n) continuity sweep
+        # each bound is fetched and value()-evaluated once:
+        # has_lb/has_ub would re-evaluate the bound for
+        # their infinity test, and an infinite bound can
+        # never satisfy the sign test anyway
+        r1_lb = self._r1.lb
+        if (r1_lb is None) or (value(r1_lb) < 0):
+            return False
+        r2_lb = self._r2.lb
+        if (r2_lb is None) or (value(r2_lb) < 0):
+            return False
+        if relax:
+            return True
+        if not (self._r1.is_continuous() and \
+                self._r2.is_continuous()):
+            return False
+        return self._x_all_continuous()
 
 class primal_exponential(_ConicBase):
     """A primal exponential conic constraint of the form:
@@ -348,6 +606,10 @@ class primal_exponential(_ConicBase):
                  "_storage_key",
                  "_active",
                  "_body",
+                 "_value_cache",
+                 "_convexity_cache",
+                 "_flat_vars",
+                 "_sym_args",
                  "_r",
                  "_x1",
                  "_x2",
@@ -358,9 +620,9 @@ class primal_exponential(_ConicBase):
         self._r = r
         self._x1 = x1
         self._x2 = x2
-        assert isinstance(self._r, IVariable)
-        assert isinstance(self._x1, IVariable)
-        assert isinstance(self._x2, IVariable)
+        self._flat_vars = (self._x1, self._x2, self._r)
+        self._sym_args = (self._r, self._x1, self._x2)
+        assert _all_variables(self._flat_vars)
 
     @classmethod
     def as_domain(cls, r, x1, x2):
@@ -407,27 +669,47 @@ class primal_exponential(_ConicBase):
         """A function that defines the body expression"""
         return x1*exp(x2/x1) - r
 
-    def _body_function_variables(self, values=False):
-        """Returns variables in the order they should be
-        passed to the body function. If values is True, then
-        return the current value of each variable in place
-        of the variables themselves."""
-        if not values:
-            return self.r, self.x1, self.x2
-        else:
-            return self.r.value, self.x1.value, self.x2.value
+    def _body_function_numeric(self, r, x1, x2):
+        """Numerically evaluates the body function given
+        the current value of each argument."""
+        # math.exp avoids building (and then evaluating)
+        # an ExpExpression node
+        return x1*math.exp(x2/x1) - r
+
+    def _vars_symbolic(self):
+        """Returns the variables in the order they should
+        be passed to the body function."""
+        return self._sym_args
+
+    def _vars_numeric(self):
+        """Returns the current value of each body function
+        argument, in the same order as _vars_symbolic."""
+        flat = self._flat_vars
+        return flat[2].value, flat[0].value, flat[1].value
 
     def check_convexity_conditions(self, relax=False):
         """Returns True if all convexity conditions for the
         conic constraint are satisfied. If relax is True,
         then variable domains are ignored and it is assumed
-        that all variables are continuous."""
-        return (relax or \
-                (self.x1.is_continuous() and \
-                 self.x2.is_continuous() and \
-                 self.r.is_continuous())) and \
-            (self.x1.has_lb() and value(self.x1.lb) >= 0) and \
-            (self.r.has_lb() and value(self.r.lb) >= 0)
+        that all variables are continuous. Conditions are
+        evaluated cheapest-first so that a failing scalar
+        test avoids the sweep over the x variables."""
+        # ordered cheapest-first
+        # each bound is fetched and value()-evaluated once:
+        # has_lb/has_ub would re-evaluate the bound for
+        # their infinity test, and an infinite bound can
+        # never satisfy the sign test anyway
+        x1_lb = self._x1.lb
+        if (x1_lb is None) or (value(x1_lb) < 0):
+            return False
+        r_lb = self._r.lb
+        if (r_lb is None) or (value(r_lb) < 0):
+            return False
+        if relax:
+            return True
+        return self._x1.is_continuous() and \
+            self._x2.is_continuous() and \
+            self._r.is_continuous()
 
 class primal_power(_ConicBase):
     """A primal power conic constraint of the form:
@@ -451,10 +733,18 @@ class primal_power(_ConicBase):
                  "_storage_key",
                  "_active",
                  "_body",
+                 "_value_cache",
+                 "_convexity_cache",
+                 "_flat_vars",
+                 "_sym_args",
+                 "_n_x",
+                 "_val_buf",
                  "_r1",
                  "_r2",
                  "_x",
                  "_alpha",
+                 "_alpha_f",
+                 "_one_minus_alpha",
                  "__weakref__")
 
     def __init__(self, r1, r2, x, alpha):
@@ -462,11 +752,23 @@ class primal_power(_ConicBase):
         self._r1 = r1
         self._r2 = r2
         self._x = tuple(x)
+        self._flat_vars = self._x + (self._r1, self._r2)
+        self._sym_args = (self._r1, self._r2, self._x)
+        self._n_x = len(self._x)
+        # a reusable buffer for gathering variable values,
+        # so numeric evaluation does not allocate per call
+        self._val_buf = array.array('d', [0.0]*self._n_x)
         self._alpha = alpha
-        assert isinstance(self._r1, IVariable)
-        assert isinstance(self._r2, IVariable)
-        assert all(isinstance(xi, IVariable)
-                   for xi in self._x)
+        # hoist the alpha constants out of the numeric
+        # evaluation path when alpha is a native numeric
+        # type (the common case)
+        if self._alpha.__class__ in (int, float):
+            self._alpha_f = float(self._alpha)
+            self._one_minus_alpha = 1.0 - self._alpha_f
+        else:
+            self._alpha_f = None
+            self._one_minus_alpha = None
+        assert _all_variables(self._flat_vars)
         if not is_numeric_data(self._alpha):
             raise TypeError(
                 "The type of the alpha parameter of a conic "
@@ -522,34 +824,84 @@ class primal_power(_ConicBase):
     def _body_function(self, r1, r2, x):
         """A function that defines the body expression"""
         alpha = self.alpha
-        return (sum(xi**2 for xi in x)**0.5) - \
+        return (quicksum(xi*xi for xi in x)**0.5) - \
             (r1**alpha) * \
             (r2**(1-alpha))
 
-    def _body_function_variables(self, values=False):
-        """Returns variables in the order they should be
-        passed to the body function. If values is True, then
-        return the current value of each variable in place
-        of the variables themselves."""
-        if not values:
-            return self.r1, self.r2, self.x
+    def _body_function_numeric(self, r1, r2, x):
+        """Numerically evaluates the body function given
+        the current value of each argument."""
+        alpha = self._alpha_f
+        if alpha is not None:
+            one_minus_alpha = self._one_minus_alpha
         else:
-            return self.r1.value, self.r2.value, \
-                tuple(xi.value for xi in self.x)
+            alpha = value(self.alpha)
+            one_minus_alpha = 1 - alpha
+        if self._n_x < _NUMPY_SUM_SQ_THRESHOLD:
+            return eval(_compiled_body('primal_power',
+                                       self._n_x),
+                        {"x": x, "r1": r1, "r2": r2,
+                         "alpha": alpha,
+                         "oma": one_minus_alpha})
+        return (_sum_of_squares_numeric(x)**0.5) - \
+            (r1**alpha) * \
+            (r2**one_minus_alpha)
+
+    def _vars_symbolic(self):
+        """Returns the variables in the order they should
+        be passed to the body function."""
+        return self._sym_args
+
+    def _vars_numeric(self):
+        """Returns the current value of each body function
+        argument, in the same order as _vars_symbolic."""
+        flat = self._flat_vars
+        buf = self._val_buf
+        n = self._n_x
+        for i in range(n):
+            buf[i] = flat[i].value
+        return flat[n].value, flat[n+1].value, buf
+
+    def _evaluation_key(self):
+        """A key that identifies the current variable
+        values, used to memoize the result of __call__."""
+        # the alpha term may be a mutable parameter, so it
+        # must be part of the key
+        return (value(self._alpha, exception=False),) + \
+            super(primal_power, self)._evaluation_key()
 
     def check_convexity_conditions(self, relax=False):
         """Returns True if all convexity conditions for the
         conic constraint are satisfied. If relax is True,
         then variable domains are ignored and it is assumed
-        that all variables are continuous."""
-        alpha = value(self.alpha, exception=False)
-        return (relax or \
-                (self.r1.is_continuous() and \
-                 self.r2.is_continuous() and \
-                 all(xi.is_continuous() for xi in self.x))) and \
-            (self.r1.has_lb() and value(self.r1.lb) >= 0) and \
-            (self.r2.has_lb() and value(self.r2.lb) >= 0) and \
-            ((alpha is not None) and (0 < alpha < 1))
+        that all variables are continuous. Conditions are
+        evaluated cheapest-first so that a failing scalar
+        test avoids the sweep over the x variables."""
+        # ordered cheapest-first: the alpha and bound
+        # tests short-circuit the O(n) continuity sweep
+        alpha = self._alpha_f
+        if alpha is None:
+            alpha = value(self.alpha, exception=False)
+            if alpha is None:
+                return False
+        if not (0 < alpha < 1):
+            return False
+        # each bound is fetched and value()-evaluated once:
+        # has_lb/has_ub would re-evaluate the bound for
+        # their infinity test, and an infinite bound can
+        # never satisfy the sign test anyway
+        r1_lb = self._r1.lb
+        if (r1_lb is None) or (value(r1_lb) < 0):
+            return False
+        r2_lb = self._r2.lb
+        if (r2_lb is None) or (value(r2_lb) < 0):
+            return False
+        if relax:
+            return True
+        if not (self._r1.is_continuous() and \
+                self._r2.is_continuous()):
+            return False
+        return self._x_all_continuous()
 
 class dual_exponential(_ConicBase):
     """A dual exponential conic constraint of the form:
@@ -571,6 +923,10 @@ class dual_exponential(_ConicBase):
                  "_storage_key",
                  "_active",
                  "_body",
+                 "_value_cache",
+                 "_convexity_cache",
+                 "_flat_vars",
+                 "_sym_args",
                  "_r",
                  "_x1",
                  "_x2",
@@ -581,9 +937,9 @@ class dual_exponential(_ConicBase):
         self._r = r
         self._x1 = x1
         self._x2 = x2
-        assert isinstance(self._r, IVariable)
-        assert isinstance(self._x1, IVariable)
-        assert isinstance(self._x2, IVariable)
+        self._flat_vars = (self._x1, self._x2, self._r)
+        self._sym_args = (self._r, self._x1, self._x2)
+        assert _all_variables(self._flat_vars)
 
     @classmethod
     def as_domain(cls, r, x1, x2):
@@ -630,27 +986,47 @@ class dual_exponential(_ConicBase):
         """A function that defines the body expression"""
         return -x2*exp((x1/x2) - 1) - r
 
-    def _body_function_variables(self, values=False):
-        """Returns variables in the order they should be
-        passed to the body function. If values is True, then
-        return the current value of each variable in place
-        of the variables themselves."""
-        if not values:
-            return self.r, self.x1, self.x2
-        else:
-            return self.r.value, self.x1.value, self.x2.value
+    def _body_function_numeric(self, r, x1, x2):
+        """Numerically evaluates the body function given
+        the current value of each argument."""
+        # math.exp avoids building (and then evaluating)
+        # an ExpExpression node
+        return -(x2*_INV_E)*math.exp(x1/x2) - r
+
+    def _vars_symbolic(self):
+        """Returns the variables in the order they should
+        be passed to the body function."""
+        return self._sym_args
+
+    def _vars_numeric(self):
+        """Returns the current value of each body function
+        argument, in the same order as _vars_symbolic."""
+        flat = self._flat_vars
+        return flat[2].value, flat[0].value, flat[1].value
 
     def check_convexity_conditions(self, relax=False):
         """Returns True if all convexity conditions for the
         conic constraint are satisfied. If relax is True,
         then variable domains are ignored and it is assumed
-        that all variables are continuous."""
-        return (relax or \
-                (self.x1.is_continuous() and \
-                 self.x2.is_continuous() and \
-                 self.r.is_continuous())) and \
-            (self.x2.has_ub() and value(self.x2.ub) <= 0) and \
-            (self.r.has_lb() and value(self.r.lb) >= 0)
+        that all variables are continuous. Conditions are
+        evaluated cheapest-first so that a failing scalar
+        test avoids the sweep over the x variables."""
+        # ordered cheapest-first
+        # each bound is fetched and value()-evaluated once:
+        # has_lb/has_ub would re-evaluate the bound for
+        # their infinity test, and an infinite bound can
+        # never satisfy the sign test anyway
+        x2_ub = self._x2.ub
+        if (x2_ub is None) or (value(x2_ub) > 0):
+            return False
+        r_lb = self._r.lb
+        if (r_lb is None) or (value(r_lb) < 0):
+            return False
+        if relax:
+            return True
+        return self._x1.is_continuous() and \
+            self._x2.is_continuous() and \
+            self._r.is_continuous()
 
 class dual_power(_ConicBase):
     """A dual power conic constraint of the form:
@@ -676,10 +1052,18 @@ class dual_power(_ConicBase):
                  "_storage_key",
                  "_active",
                  "_body",
+                 "_value_cache",
+                 "_convexity_cache",
+                 "_flat_vars",
+                 "_sym_args",
+                 "_n_x",
+                 "_val_buf",
                  "_r1",
                  "_r2",
                  "_x",
                  "_alpha",
+                 "_alpha_f",
+                 "_one_minus_alpha",
                  "__weakref__")
 
     def __init__(self, r1, r2, x, alpha):
@@ -687,11 +1071,23 @@ class dual_power(_ConicBase):
         self._r1 = r1
         self._r2 = r2
         self._x = tuple(x)
+        self._flat_vars = self._x + (self._r1, self._r2)
+        self._sym_args = (self._r1, self._r2, self._x)
+        self._n_x = len(self._x)
+        # a reusable buffer for gathering variable values,
+        # so numeric evaluation does not allocate per call
+        self._val_buf = array.array('d', [0.0]*self._n_x)
         self._alpha = alpha
-        assert isinstance(self._r1, IVariable)
-        assert isinstance(self._r2, IVariable)
-        assert all(isinstance(xi, IVariable)
-                   for xi in self._x)
+        # hoist the alpha constants out of the numeric
+        # evaluation path when alpha is a native numeric
+        # type (the common case)
+        if self._alpha.__class__ in (int, float):
+            self._alpha_f = float(self._alpha)
+            self._one_minus_alpha = 1.0 - self._alpha_f
+        else:
+            self._alpha_f = None
+            self._one_minus_alpha = None
+        assert _all_variables(self._flat_vars)
         if not is_numeric_data(self._alpha):
             raise TypeError(
                 "The type of the alpha parameter of a conic "
@@ -747,31 +1143,81 @@ class dual_power(_ConicBase):
     def _body_function(self, r1, r2, x):
         """A function that defines the body expression"""
         alpha = self.alpha
-        return (sum(xi**2 for xi in x)**0.5) - \
+        return (quicksum(xi*xi for xi in x)**0.5) - \
             ((r1/alpha)**alpha) * \
             ((r2/(1-alpha))**(1-alpha))
 
-    def _body_function_variables(self, values=False):
-        """Returns variables in the order they should be
-        passed to the body function. If values is True, then
-        return the current value of each variable in place
-        of the variables themselves."""
-        if not values:
-            return self.r1, self.r2, self.x
+    def _body_function_numeric(self, r1, r2, x):
+        """Numerically evaluates the body function given
+        the current value of each argument."""
+        alpha = self._alpha_f
+        if alpha is not None:
+            one_minus_alpha = self._one_minus_alpha
         else:
-            return self.r1.value, self.r2.value, \
-                tuple(xi.value for xi in self.x)
+            alpha = value(self.alpha)
+            one_minus_alpha = 1 - alpha
+        if self._n_x < _NUMPY_SUM_SQ_THRESHOLD:
+            return eval(_compiled_body('dual_power',
+                                       self._n_x),
+                        {"x": x, "r1": r1, "r2": r2,
+                         "alpha": alpha,
+                         "oma": one_minus_alpha})
+        return (_sum_of_squares_numeric(x)**0.5) - \
+            ((r1/alpha)**alpha) * \
+            ((r2/one_minus_alpha)**one_minus_alpha)
+
+    def _vars_symbolic(self):
+        """Returns the variables in the order they should
+        be passed to the body function."""
+        return self._sym_args
+
+    def _vars_numeric(self):
+        """Returns the current value of each body function
+        argument, in the same order as _vars_symbolic."""
+        flat = self._flat_vars
+        buf = self._val_buf
+        n = self._n_x
+        for i in range(n):
+            buf[i] = flat[i].value
+        return flat[n].value, flat[n+1].value, buf
+
+    def _evaluation_key(self):
+        """A key that identifies the current variable
+        values, used to memoize the result of __call__."""
+        # the alpha term may be a mutable parameter, so it
+        # must be part of the key
+        return (value(self._alpha, exception=False),) + \
+            super(dual_power, self)._evaluation_key()
 
     def check_convexity_conditions(self, relax=False):
         """Returns True if all convexity conditions for the
         conic constraint are satisfied. If relax is True,
         then variable domains are ignored and it is assumed
-        that all variables are continuous."""
-        alpha = value(self.alpha, exception=False)
-        return (relax or \
-                (self.r1.is_continuous() and \
-                 self.r2.is_continuous() and \
-                 all(xi.is_continuous() for xi in self.x))) and \
-            (self.r1.has_lb() and value(self.r1.lb) >= 0) and \
-            (self.r2.has_lb() and value(self.r2.lb) >= 0) and \
-            ((alpha is not None) and (0 < alpha < 1))
+        that all variables are continuous. Conditions are
+        evaluated cheapest-first so that a failing scalar
+        test avoids the sweep over the x variables."""
+        # ordered cheapest-first: the alpha and bound
+        # tests short-circuit the O(n) continuity sweep
+        alpha = self._alpha_f
+        if alpha is None:
+            alpha = value(self.alpha, exception=False)
+            if alpha is None:
+                return False
+        if not (0 < alpha < 1):
+            return False
+        # each bound is fetched and value()-evaluated once:
+        # has_lb/has_ub would re-evaluate the bound for
+        # their infinity test, and an infinite bound can
+        # never satisfy the sign test anyway
+        r1_lb = self._r1.lb
+        if (r1_lb is None) or (value(r1_lb) < 0):
+            return False
+        r2_lb = self._r2.lb
+        if (r2_lb is None) or (value(r2_lb) < 0):
+            return False
+        if relax:
+            return True
+        if not (self._r1.is_continuous() and \
+                self._r2.is_continuous()):
+            return False
+        return self._x_all_continuous()
@@ -193,6 +193,12 @@ class Test_quadratic(_conic_tester_base,
         self.assertEqual(c.lslack, float('inf'))
         self.assertEqual(c.uslack, -val)
         self.assertIsNot(c._body, None)
+        # verify that the memoized value is discarded
+        # when a variable value changes
+        c.x[0].value = 7
+        val = 7**2 + 2**2 - 3**2
+        self.assertEqual(c(), val)
+        self.assertEqual(c(), val)
 
     def test_check_convexity_conditions(self):
         c = self._object_factory()
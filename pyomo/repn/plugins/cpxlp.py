@@ -400,6 +400,7 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
         create_symbol_func = SymbolMap.createSymbol
         create_symbols_func = SymbolMap.createSymbols
         alias_symbol_func = SymbolMap.alias
+        no_negative_zero = _no_negative_zero
         variable_label_pairs = []
 
         # populate the symbol map in a single pass.
@@ -651,7 +652,7 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                 bound = constraint_data.lower
                 bound = _get_bound(bound) - offset
                 output.append(eq_string_template
-                                  % (_no_negative_zero(bound)))
+                                  % (no_negative_zero(bound)))
                 output.append("\n")
             else:
                 if constraint_data.has_lb():
@@ -671,7 +672,7 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                     bound = constraint_data.lower
                     bound = _get_bound(bound) - offset
                     output.append(geq_string_template
-                                      % (_no_negative_zero(bound)))
+                                      % (no_negative_zero(bound)))
                 else:
                     assert constraint_data.has_ub()
 
@@ -692,7 +693,7 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                     bound = constraint_data.upper
                     bound = _get_bound(bound) - offset
                     output.append(leq_string_template
-                                      % (_no_negative_zero(bound)))
+                                      % (no_negative_zero(bound)))
                 else:
                     assert constraint_data.has_lb()
 
@@ -821,10 +822,10 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
 
                 output.append("   ")
                 output.append(lb_string_template
-                                      % (_no_negative_zero(vardata_lb)))
+                                      % (no_negative_zero(vardata_lb)))
                 output.append(name_to_output)
                 output.append(ub_string_template
-                                      % (_no_negative_zero(vardata_ub)))
+                                      % (no_negative_zero(vardata_ub)))
             else:
                 vardata_lb = _get_bound(vardata.lb)
                 vardata_ub = _get_bound(vardata.ub)
@@ -833,14 +834,14 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                 output.append("   ")
                 if vardata.has_lb():
                     output.append(lb_string_template
-                                      % (_no_negative_zero(vardata_lb)))
+                                      % (no_negative_zero(vardata_lb)))
                 else:
                     output.append(" -inf <= ")
 
                 output.append(name_to_output)
                 if vardata.has_ub():
                     output.append(ub_string_template
-                                      % (_no_negative_zero(vardata_ub)))
+                                      % (no_negative_zero(vardata_ub)))
                 else:
                     output.append(" <= +inf\n")
 
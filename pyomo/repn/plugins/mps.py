@@ -273,6 +273,7 @@ class ProblemWriter_mps(AbstractProblemWriter):
         create_symbol_func = SymbolMap.createSymbol
         create_symbols_func = SymbolMap.createSymbols
         alias_symbol_func = SymbolMap.alias
+        no_negative_zero = _no_negative_zero
         variable_label_pairs = []
 
         sortOrder = SortComponents.unsorted
@@ -312,7 +313,8 @@ class ProblemWriter_mps(AbstractProblemWriter):
         # sort the variable ordering by the user
         # column_order ComponentMap
         if column_order is not None:
-            variable_list.sort(key=lambda _x: column_order[_x])
+            # the bound __getitem__ avoids a lambda frame per element
+            variable_list.sort(key=column_order.__getitem__)
 
         # prepare to hold the sparse columns
         variable_to_column = ComponentMap(
@@ -488,7 +490,7 @@ class ProblemWriter_mps(AbstractProblemWriter):
                     variable_to_column)
                 bound = constraint_data.lower
                 bound = _get_bound(bound) - offset
-                rhs_data.append((label, _no_negative_zero(bound)))
+                rhs_data.append((label, no_negative_zero(bound)))
             else:
                 if constraint_data.has_lb():
                     if constraint_data.has_ub():
@@ -505,7 +507,7 @@ class ProblemWriter_mps(AbstractProblemWriter):
                         variable_to_column)
                     bound = constraint_data.lower
                     bound = _get_bound(bound) - offset
-                    rhs_data.append((label, _no_negative_zero(bound)))
+                    rhs_data.append((label, no_negative_zero(bound)))
                 else:
                     assert constraint_data.has_ub()
 
@@ -524,7 +526,7 @@ class ProblemWriter_mps(AbstractProblemWriter):
                         variable_to_column)
                     bound = constraint_data.upper
                     bound = _get_bound(bound) - offset
-                    rhs_data.append((label, _no_negative_zero(bound)))
+                    rhs_data.append((label, no_negative_zero(bound)))
                 else:
                     assert constraint_data.has_lb()
 
@@ -538,18 +540,20 @@ class ProblemWriter_mps(AbstractProblemWriter):
         # COLUMNS section
         #
         column_template = "     %s %s %"+self._precision_string+"\n"
-        output_file.write("COLUMNS\n")
+        # like the RHS section below, accumulate the formatted lines
+        # and emit the section with a single write call
+        column_lines = ["COLUMNS\n"]
         cnt = 0
         for vardata in variable_list:
             col_entries = column_data[variable_to_column[vardata]]
             cnt += 1
             if len(col_entries) > 0:
                 var_label = variable_symbol_dictionary[id(vardata)]
-                for i, (row_label, coef) in enumerate(col_entries):
-                    output_file.write(column_template
-                                      % (var_label,
-                                         row_label,
-                                         _no_negative_zero(coef)))
+                for row_label, coef in col_entries:
+                    column_lines.append(column_template
+                                        % (var_label,
+                                           row_label,
+                                           no_negative_zero(coef)))
             elif include_all_variable_bounds:
                 # the column is empty, so add a (0 * var)
                 # term to the objective
@@ -559,29 +563,31 @@ class ProblemWriter_mps(AbstractProblemWriter):
                 #   seem to work for CPLEX 12.6, so I am
                 #   doing it this way so that it will work for both
                 var_label = variable_symbol_dictionary[id(vardata)]
-                output_file.write(column_template
-                                  % (var_label,
-                                     objective_label,
-                                     0))
+                column_lines.append(column_template
+                                    % (var_label,
+                                       objective_label,
+                                       0))
 
         assert cnt == len(column_data)-1
         if len(column_data[-1]) > 0:
             col_entries = column_data[-1]
             var_label = "ONE_VAR_CONSTANT"
-            for i, (row_label, coef) in enumerate(col_entries):
-                output_file.write(column_template
-                                  % (var_label,
-                                     row_label,
-                                     _no_negative_zero(coef)))
+            for row_label, coef in col_entries:
+                column_lines.append(column_template
+                                    % (var_label,
+                                       row_label,
+                                       no_negative_zero(coef)))
+        output_file.write("".join(column_lines))
 
         #
         # RHS section
         #
         rhs_template = "     RHS %s %"+self._precision_string+"\n"
-        output_file.write("RHS\n")
-        for i, (row_label, rhs) in enumerate(rhs_data):
-            # note: we have already converted any -0 to 0 by this point
-            output_file.write(rhs_template % (row_label, rhs))
+        # batch the section into a single write call - a per-row
+        # output_file.write is measurably slower on large models
+        # note: we have already converted any -0 to 0 by this point
+        output_file.write("RHS\n" + "".join(
+            rhs_template % entry for entry in rhs_data))
 
         # SOS constraints
         SOSlines = StringIO()
@@ -618,11 +624,15 @@ class ProblemWriter_mps(AbstractProblemWriter):
         # BOUNDS section
         #
         entry_template = "%s %"+self._precision_string+"\n"
-        output_file.write("BOUNDS\n")
+        # accumulate the formatted lines and emit the section
+        # with a single write call
+        bounds_lines = ["BOUNDS\n"]
+        referenced_variable_ids = self._referenced_variable_ids
         for vardata in variable_list:
+            vardata_id = id(vardata)
             if include_all_variable_bounds or \
-               (id(vardata) in self._referenced_variable_ids):
-                var_label = variable_symbol_dictionary[id(vardata)]
+               (vardata_id in referenced_variable_ids):
+                var_label = variable_symbol_dictionary[vardata_id]
                 if vardata.fixed:
                     if not output_fixed_variable_bounds:
                         raise ValueError(
@@ -634,20 +644,20 @@ class ProblemWriter_mps(AbstractProblemWriter):
                             "in the MPS file." % (vardata.name, model.name))
                     if vardata.value is None:
                         raise ValueError("Variable cannot be fixed to a value of None.")
-                    output_file.write((" FX BOUND "+entry_template)
+                    bounds_lines.append((" FX BOUND "+entry_template)
                                       % (var_label,
-                                         _no_negative_zero(value(vardata.value))))
+                                         no_negative_zero(value(vardata.value))))
                     continue
 
                 # convert any -0 to 0 to make baseline diffing easier
-                vardata_lb = _no_negative_zero(_get_bound(vardata.lb))
-                vardata_ub = _no_negative_zero(_get_bound(vardata.ub))
+                vardata_lb = no_negative_zero(_get_bound(vardata.lb))
+                vardata_ub = no_negative_zero(_get_bound(vardata.ub))
                 unbounded_lb = not vardata.has_lb()
                 unbounded_ub = not vardata.has_ub()
                 treat_as_integer = False
                 if vardata.is_binary():
                     if (vardata_lb == 0) and (vardata_ub == 1):
-                        output_file.write(" BV BOUND %s\n" % (var_label))
+                        bounds_lines.append(" BV BOUND %s\n" % (var_label))
                         continue
                     else:
                         # so we can add bounds
@@ -661,30 +671,32 @@ class ProblemWriter_mps(AbstractProblemWriter):
                     #         but CPLEX 12.6 does not, so I am just
                     #         using a large value
                     if not unbounded_lb:
-                        output_file.write((" LI BOUND "+entry_template)
+                        bounds_lines.append((" LI BOUND "+entry_template)
                                           % (var_label, vardata_lb))
                     else:
-                        output_file.write(" LI BOUND %s -10E20\n" % (var_label))
+                        bounds_lines.append(" LI BOUND %s -10E20\n" % (var_label))
                     if not unbounded_ub:
-                        output_file.write((" UI BOUND "+entry_template)
+                        bounds_lines.append((" UI BOUND "+entry_template)
                                           % (var_label, vardata_ub))
                     else:
-                        output_file.write(" UI BOUND %s 10E20\n" % (var_label))
+                        bounds_lines.append(" UI BOUND %s 10E20\n" % (var_label))
                 else:
                     assert vardata.is_continuous()
                     if unbounded_lb and unbounded_ub:
-                        output_file.write(" FR BOUND %s\n" % (var_label))
+                        bounds_lines.append(" FR BOUND %s\n" % (var_label))
                     else:
                         if not unbounded_lb:
-                            output_file.write((" LO BOUND "+entry_template)
+                            bounds_lines.append((" LO BOUND "+entry_template)
                                               % (var_label, vardata_lb))
                         else:
-                            output_file.write(" MI BOUND %s\n" % (var_label))
+                            bounds_lines.append(" MI BOUND %s\n" % (var_label))
 
                         if not unbounded_ub:
-                            output_file.write((" UP BOUND "+entry_template)
+                            bounds_lines.append((" UP BOUND "+entry_template)
                                               % (var_label, vardata_ub))
 
+        output_file.write("".join(bounds_lines))
+
         #
         # SOS section
         #
@@ -723,18 +735,18 @@ class ProblemWriter_mps(AbstractProblemWriter):
                     output_file.write(column_template
                                       % (var1_label,
                                          var2_label,
-                                         _no_negative_zero(coef * 2)))
+                                         no_negative_zero(coef * 2)))
                 else:
                     # the matrix needs to be symmetric so split
                     # the coefficient (but remember it is divided by 2)
                     output_file.write(column_template
                                       % (var1_label,
                                          var2_label,
-                                         _no_negative_zero(coef)))
+                                         no_negative_zero(coef)))
                     output_file.write(column_template
                                       % (var2_label,
                                          var1_label,
-                                         _no_negative_zero(coef)))
+                                         no_negative_zero(coef)))
 
         #
         # QCMATRIX section
@@ -759,14 +771,14 @@ class ProblemWriter_mps(AbstractProblemWriter):
                         output_file.write(column_template
                                           % (var1_label,
                                              var2_label,
-                                             _no_negative_zero(coef)))
+                                             no_negative_zero(coef)))
                     else:
                         # the matrix needs to be symmetric so split
                         # the coefficient
                         output_file.write(column_template
                                           % (var1_label,
                                              var2_label,
-                                             _no_negative_zero(coef * 0.5)))
+                                             no_negative_zero(coef * 0.5)))
                         output_file.write(column_template
                                           % (var2_label,
                                              var1_label,
@@ -72,6 +72,7 @@ if using_cython:
             "pyomo/core/expr/numeric_expr.pyx",
             "pyomo/core/expr/logical_expr.pyx",
             #"pyomo/core/expr/visitor.pyx",
+            "pyomo/core/kernel/conic.pyx",
             "pyomo/core/util.pyx",
             "pyomo/repn/standard_repn.pyx",
             "pyomo/repn/plugins/cpxlp.pyx",